@@ -1,44 +1,124 @@
 # adapters/polymarket.py
-import requests
-from domain.snapshots import PolySnapshot
-from datetime import datetime, timezone
+import asyncio
+import time
+import aiohttp
+from cachetools import TTLCache
+from market_parity.domain.snapshots import PolySnapshot
+from market_parity.io._session import get_json, open_session, post_json
 
 BASE_URL = "https://clob.polymarket.com"
+MAX_CONCURRENCY = 16  # requests in flight at once; higher starts drawing 429s
+BOOKS_PER_REQUEST = 100  # token_ids per POST /books call
 
-def fetch_yes_mid(market_id: str) -> PolySnapshot:
+# market_id -> YES token_id. Token ids practically never change, so repeated
+# sweeps skip the /markets/{id} round-trip; the TTL bounds any staleness.
+_YES_TOKEN_IDS: TTLCache = TTLCache(maxsize=4096, ttl=3600)
+
+
+async def _gather(coros) -> list:
     """
-    Given a Polymarket market_id (condition_id),
-    fetch the YES token's best bid/ask and return a PolySnapshot.
+    Run ``coros`` concurrently and return their results in order.
+
+    Unlike a bare asyncio.gather, the first failure cancels the other tasks
+    before it propagates, so none of them outlive the caller's session. The
+    first error is re-raised on its own rather than as an ExceptionGroup.
+    """
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(c) for c in coros]
+    except BaseExceptionGroup as errors:
+        raise errors.exceptions[0] from None
+    return [t.result() for t in tasks]
+
+
+async def _fetch_market(session: aiohttp.ClientSession, limiter: asyncio.Semaphore, market_id: str) -> dict:
+    """Fetch the market object for a condition_id."""
+    async with limiter:
+        return await get_json(session, f"{BASE_URL}/markets/{market_id}")
+
+
+async def _fetch_books(session: aiohttp.ClientSession, limiter: asyncio.Semaphore, token_ids: list[str]) -> list[dict]:
     """
-    # Step 1: Fetch the market object
-    market_resp = requests.get(f"{BASE_URL}/markets/{market_id}")
-    market_resp.raise_for_status()
-    market = market_resp.json()
+    Fetch the order books for many outcome tokens, in the order given.
+
+    Uses the batched POST /books endpoint, so N tokens cost
+    ceil(N / BOOKS_PER_REQUEST) requests instead of N GET /book calls.
+    """
+    async def fetch_chunk(chunk: list[str]) -> list[dict]:
+        async with limiter:
+            return await post_json(session, f"{BASE_URL}/books", [{"token_id": t} for t in chunk])
+
+    chunks = [token_ids[i:i + BOOKS_PER_REQUEST] for i in range(0, len(token_ids), BOOKS_PER_REQUEST)]
+    replies = await _gather(fetch_chunk(c) for c in chunks)
+    by_token = {book["asset_id"]: book for reply in replies for book in reply}
+    for token_id in token_ids:
+        if token_id not in by_token:
+            raise ValueError(f"No order book returned for token {token_id}")
+    return [by_token[t] for t in token_ids]
 
-    # Step 2: Find the YES token_id
-    yes_token_id = None
-    for token in market.get("tokens", []):
+
+def _yes_token_id(market: dict, market_id: str) -> str:
+    for token in market.get("tokens") or ():
         if token.get("outcome") == "YES":
-            yes_token_id = token["token_id"]
-            break
-    if yes_token_id is None:
-        raise ValueError(f"No YES token found for market {market_id}")
+            return token["token_id"]
+    raise ValueError(f"No YES token found for market {market_id}")
+
+
+async def _resolve_yes_token_id(session: aiohttp.ClientSession, limiter: asyncio.Semaphore, market_id: str) -> str:
+    """YES token_id for a market, from the cache or a fresh market lookup."""
+    token_id = _YES_TOKEN_IDS.get(market_id)
+    if token_id is None:
+        market = await _fetch_market(session, limiter, market_id)
+        token_id = _YES_TOKEN_IDS[market_id] = _yes_token_id(market, market_id)
+    return token_id
+
 
-    # Step 3: Fetch the order book for the YES token
-    book_resp = requests.get(f"{BASE_URL}/book?token_id={yes_token_id}")
-    book_resp.raise_for_status()
-    book = book_resp.json()
+def clear_cache() -> None:
+    """Forget every cached YES token_id."""
+    _YES_TOKEN_IDS.clear()
 
-    # Step 4: Extract best bid and ask
+
+def _to_snapshot(market_id: str, book: dict) -> PolySnapshot:
     best_bid = float(book["bids"][0]["price"]) if book.get("bids") else 0.0
     best_ask = float(book["asks"][0]["price"]) if book.get("asks") else 1.0
-    yes_mid = (best_bid + best_ask) / 2
-
-    # Step 5: Return PolySnapshot
     return PolySnapshot(
         market_id=market_id,
-        ts=datetime.now(timezone.utc).isoformat(),
+        ts_ns=time.time_ns(),
         yes_bid=best_bid,
         yes_ask=best_ask,
-        yes_mid=yes_mid,
+        yes_mid=(best_bid + best_ask) / 2,
     )
+
+
+async def fetch_many(market_ids: list[str]) -> list[PolySnapshot]:
+    """
+    Snapshot the YES token of several markets at once.
+
+    All market lookups go out concurrently, then the books are fetched in
+    batches, so N markets cost about two round-trips instead of 2N. YES token
+    ids are cached for an hour, so repeat sweeps only pay for the books.
+    Results follow the input order.
+    """
+    limiter = asyncio.Semaphore(MAX_CONCURRENCY)
+    async with open_session(MAX_CONCURRENCY) as session:
+        # Step 1: Resolve each YES token_id (cached across calls)
+        token_ids = await _gather(_resolve_yes_token_id(session, limiter, m) for m in market_ids)
+
+        # Step 2: Fetch every YES order book in batched requests
+        books = await _fetch_books(session, limiter, token_ids)
+
+    # Step 3: Extract best bid/ask into PolySnapshots
+    return [_to_snapshot(m, book) for m, book in zip(market_ids, books)]
+
+
+async def fetch_yes_mid_async(market_id: str) -> PolySnapshot:
+    """Async form of :func:`fetch_yes_mid`."""
+    return (await fetch_many([market_id]))[0]
+
+
+def fetch_yes_mid(market_id: str) -> PolySnapshot:
+    """
+    Given a Polymarket market_id (condition_id),
+    fetch the YES token's best bid/ask and return a PolySnapshot.
+    """
+    return asyncio.run(fetch_many([market_id]))[0]
@@ -1,10 +1,90 @@
 # domain/snapshots.py
+import time
 from dataclasses import dataclass
+from datetime import datetime, timezone
 
-@dataclass
+import numpy as np
+
+@dataclass(slots=True, frozen=True)
 class PolySnapshot:
     market_id: str     # The Polymarket condition_id (market identifier)
-    ts: str            # Timestamp when this snapshot was taken
+    ts_ns: int         # When this snapshot was taken, ns since the Unix epoch (UTC)
     yes_bid: float     # Best bid price for YES
     yes_ask: float     # Best ask price for YES
-    yes_mid: float     # Midpoint price (average of bid and ask)
\ No newline at end of file
+    yes_mid: float     # Midpoint price (average of bid and ask)
+
+    @property
+    def ts(self) -> str:
+        """ISO-8601 form of ts_ns, formatted only when asked for."""
+        return datetime.fromtimestamp(self.ts_ns / 1e9, tz=timezone.utc).isoformat()
+
+
+TICKS_PER_UNIT = 1000  # Polymarket prices live in [0, 1] with $0.001 ticks
+
+
+def _to_ticks(prices: np.ndarray) -> np.ndarray:
+    return np.round(prices * TICKS_PER_UNIT).astype(np.int16)
+
+
+@dataclass
+class PolySnapshotBatch:
+    """
+    Many PolySnapshots stored column-wise, one array per field.
+
+    Prices are kept as int16 ticks (0..1000) rather than floats, a quarter of
+    the bytes per row; the float views are computed when asked for. Spread/mid
+    calculations over a batch are single vectorised NumPy ops instead of a
+    Python loop over snapshot objects. ``batch[i]`` rebuilds the i-th
+    PolySnapshot.
+    """
+    market_id: np.ndarray      # object array of condition_ids
+    ts: np.ndarray             # datetime64[ns], UTC
+    yes_bid_ticks: np.ndarray  # int16, price * TICKS_PER_UNIT
+    yes_ask_ticks: np.ndarray  # int16, price * TICKS_PER_UNIT
+
+    @classmethod
+    def from_dicts(cls, books: list[dict]) -> "PolySnapshotBatch":
+        """
+        Build a batch from dicts with market_id, yes_bid and yes_ask keys.
+
+        Every row is stamped with the same batch time.
+        """
+        n = len(books)
+        yes_bid = np.fromiter((b["yes_bid"] for b in books), dtype=np.float64, count=n)
+        yes_ask = np.fromiter((b["yes_ask"] for b in books), dtype=np.float64, count=n)
+        now = np.datetime64(time.time_ns(), "ns")
+        return cls(
+            market_id=np.fromiter((b["market_id"] for b in books), dtype=object, count=n),
+            ts=np.full(n, now),
+            yes_bid_ticks=_to_ticks(yes_bid),
+            yes_ask_ticks=_to_ticks(yes_ask),
+        )
+
+    @property
+    def yes_bid(self) -> np.ndarray:
+        return self.yes_bid_ticks.astype(np.float32) * np.float32(1 / TICKS_PER_UNIT)
+
+    @property
+    def yes_ask(self) -> np.ndarray:
+        return self.yes_ask_ticks.astype(np.float32) * np.float32(1 / TICKS_PER_UNIT)
+
+    @property
+    def yes_mid(self) -> np.ndarray:
+        # Sum in integer ticks (at most 2000, fits int16) and scale by half a
+        # tick; halving the ticks first would drop odd half-ticks.
+        return (self.yes_bid_ticks + self.yes_ask_ticks).astype(np.float32) * np.float32(
+            0.5 / TICKS_PER_UNIT
+        )
+
+    def __len__(self) -> int:
+        return len(self.market_id)
+
+    def __getitem__(self, i: int) -> PolySnapshot:
+        bid_ticks, ask_ticks = int(self.yes_bid_ticks[i]), int(self.yes_ask_ticks[i])
+        return PolySnapshot(
+            market_id=self.market_id[i],
+            ts_ns=int(self.ts[i].astype("datetime64[ns]").astype(np.int64)),
+            yes_bid=bid_ticks / TICKS_PER_UNIT,
+            yes_ask=ask_ticks / TICKS_PER_UNIT,
+            yes_mid=(bid_ticks + ask_ticks) / (2 * TICKS_PER_UNIT),
+        )
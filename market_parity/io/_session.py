@@ -0,0 +1,69 @@
+"""
+Shared HTTP plumbing for the Polymarket clients.
+
+One pooled aiohttp session per run keeps TCP/TLS connections alive between
+calls, and every request is retried with exponential backoff on rate limits,
+5xx responses, dropped connections and timeouts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import aiohttp
+import orjson
+
+RETRIES = 3
+BACKOFF = 0.3  # seconds before the first retry, doubled after each one
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def open_session(limit: int) -> aiohttp.ClientSession:
+    """Session whose connector keeps up to ``limit`` sockets open for reuse."""
+    connector = aiohttp.TCPConnector(limit=limit, ttl_dns_cache=300)
+    return aiohttp.ClientSession(
+        connector=connector, headers={"Accept-Encoding": "gzip, deflate"}
+    )
+
+
+async def request(
+    session: aiohttp.ClientSession, method: str, url: str, **kwargs
+) -> aiohttp.ClientResponse:
+    """
+    Send a request, retrying transient failures.
+
+    Responses with a RETRY_STATUSES code, dropped connections and timeouts
+    (including the session's total timeout) are retried up to RETRIES times
+    with exponential backoff. The response comes back unread; use it as
+    ``async with await request(...)``. Non-retryable error statuses raise
+    ``aiohttp.ClientResponseError``.
+    """
+    for attempt in range(RETRIES + 1):
+        try:
+            resp = await session.request(method, url, **kwargs)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if attempt == RETRIES:
+                raise
+        else:
+            if resp.status not in RETRY_STATUSES or attempt == RETRIES:
+                if not resp.ok:
+                    resp.release()
+                    resp.raise_for_status()
+                return resp
+            resp.release()
+        await asyncio.sleep(BACKOFF * 2 ** attempt)
+    raise AssertionError("unreachable")
+
+
+async def get_json(session: aiohttp.ClientSession, url: str, **kwargs):
+    """GET ``url`` and decode the body with orjson."""
+    async with await request(session, "GET", url, **kwargs) as resp:
+        return orjson.loads(await resp.read())
+
+
+async def post_json(session: aiohttp.ClientSession, url: str, payload, **kwargs):
+    """POST ``payload`` as orjson-encoded JSON and decode the JSON reply."""
+    data = orjson.dumps(payload)
+    headers = {"Content-Type": "application/json"}
+    async with await request(session, "POST", url, data=data, headers=headers, **kwargs) as resp:
+        return orjson.loads(await resp.read())
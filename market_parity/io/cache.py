@@ -0,0 +1,117 @@
+"""
+Two-level cache for decoded API pages.
+
+An in-process LRU of parsed dicts sits in front of zstd-compressed JSON files
+on disk, so a hit costs neither a round-trip nor a full JSON parse. Entries
+expire after ``max_age`` seconds in both tiers, since the markets on a page
+(closed/active flags, end dates) change over time.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+import orjson
+import zstandard
+
+DEFAULT_MAX_AGE = 600.0  # seconds
+
+
+def default_dir() -> Path | None:
+    """``$XDG_CACHE_HOME/poly_arb/pages``, or None if there is no home to fall back on."""
+    base = os.environ.get("XDG_CACHE_HOME")
+    if not base:
+        try:
+            base = Path.home() / ".cache"
+        except (RuntimeError, KeyError):
+            # No $HOME and no passwd entry, e.g. some containers and CI users.
+            return None
+    return Path(base) / "poly_arb" / "pages"
+
+
+class PageCache:
+    """
+    Pages keyed by request URL; the disk file name is the URL's SHA-256.
+
+    ``directory`` defaults to :func:`default_dir`; if that cannot be resolved
+    the cache keeps only its memory tier.
+    """
+
+    def __init__(
+        self, directory: Path | None = None, maxsize: int = 256, max_age: float = DEFAULT_MAX_AGE
+    ) -> None:
+        if directory is None:
+            directory = default_dir()
+        self.directory = Path(directory) if directory is not None else None
+        self.maxsize = maxsize
+        self.max_age = max_age
+        self._memory: OrderedDict[str, tuple[float, dict]] = OrderedDict()  # key -> (stored_at, page)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.json.zst"
+
+    def _remember(self, key: str, page: dict, stored_at: float) -> None:
+        self._memory[key] = (stored_at, page)
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> dict | None:
+        """Cached page for ``key``, or None if absent or older than ``max_age``."""
+        now = time.time()
+        entry = self._memory.get(key)
+        if entry is not None:
+            stored_at, page = entry
+            if now - stored_at <= self.max_age:
+                self._memory.move_to_end(key)
+                return page
+            del self._memory[key]
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            stored_at = path.stat().st_mtime
+            if now - stored_at > self.max_age:
+                return None
+            page = orjson.loads(zstandard.decompress(path.read_bytes()))
+        except (OSError, zstandard.ZstdError, orjson.JSONDecodeError):
+            # Missing, unreadable or corrupt files are all just misses.
+            return None
+        self._remember(key, page, stored_at)
+        return page
+
+    def put(self, key: str, page: dict) -> None:
+        """
+        Store ``page`` in memory and on disk.
+
+        The cache is best-effort: if there is no cache directory or the disk
+        write fails (read-only home, full disk, ...) the page is only kept in
+        memory.
+        """
+        self._remember(key, page, time.time())
+        if self.directory is None:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            return
+        # Write to a temp file and rename so a concurrent reader never sees a torn file.
+        written = False
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(zstandard.compress(orjson.dumps(page)))
+            os.replace(tmp, self._path(key))
+            written = True
+        except OSError:
+            pass
+        finally:
+            if not written:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp)
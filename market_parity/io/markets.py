@@ -0,0 +1,274 @@
+"""
+Keyword search over the paginated Polymarket CLOB /markets listing.
+
+The CLOB pages with an opaque-looking ``next_cursor`` that is in practice the
+base64-encoded integer offset of the next page. Once the first page has shown
+the step between offsets, the following pages are requested speculatively in
+parallel; if a cursor ever fails to decode, or a page's real next_cursor
+differs from the guessed one, scanning falls back to one page at a time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import binascii
+import functools
+from datetime import datetime, timezone
+from typing import Callable
+
+import aiohttp
+import ijson
+
+from market_parity.io._session import get_json, open_session, request
+from market_parity.io.cache import PageCache
+
+BASE_URL = "https://clob.polymarket.com"
+FIRST_CURSOR = "MA=="  # base64("0")
+END_CURSOR = "LTE="    # base64("-1"), returned on the last page
+CONCURRENCY = 8        # pages in flight at once; keeps us under the rate limit
+
+_PAGE_CACHE = PageCache()
+
+
+def _fold(text: str) -> str:
+    """Casefold, taking str.lower()'s ASCII fast path when it gives the same result."""
+    # Market questions are almost always ASCII, where lower() == casefold()
+    # but skips casefold's Unicode table lookups.
+    return text.lower() if text.isascii() else text.casefold()
+
+
+def fold_keywords(keywords: list[str]) -> list[str]:
+    """
+    Casefold keywords once per search, longest first.
+
+    Longer keywords are rarer in market questions, so checking them first lets
+    the matcher reject most questions on the first test.
+    """
+    return sorted({_fold(k) for k in keywords if k}, key=len, reverse=True)
+
+
+def build_matcher(folded_keywords: list[str]) -> Callable[[str], bool]:
+    """
+    Compile folded keywords into a question predicate.
+
+    The predicate is generated for this exact query, with the keywords inlined
+    as constants, so every question costs one fold plus chained ``in`` checks
+    that stop at the first missing keyword.
+    """
+    checks = " and ".join(f"{k!r} in q" for k in folded_keywords) or "True"
+    src = (
+        "def matches(question):\n"
+        "    q = _fold(question)\n"
+        f"    return {checks}\n"
+    )
+    namespace: dict = {"_fold": _fold}
+    exec(compile(src, "<matcher>", "exec"), namespace)
+    return namespace["matches"]
+
+
+def _decode_cursor(cursor: str) -> int | None:
+    """Offset behind a CLOB cursor, or None if it is not a base64 integer."""
+    try:
+        return int(base64.b64decode(cursor, validate=True))
+    except (binascii.Error, ValueError):
+        return None
+
+
+def _encode_cursor(offset: int) -> str:
+    return base64.b64encode(str(offset).encode()).decode()
+
+
+def _cursor_batch(cursor: str, step: int | None, size: int) -> list[str]:
+    """``cursor`` followed by the cursors we expect to come after it."""
+    offset = _decode_cursor(cursor)
+    if step is None or offset is None:
+        return [cursor]
+    return [cursor] + [_encode_cursor(offset + i * step) for i in range(1, size)]
+
+
+def _page_key(cursor: str) -> str:
+    return f"{BASE_URL}/markets?next_cursor={cursor}"
+
+
+async def fetch_page(session: aiohttp.ClientSession, cursor: str) -> dict:
+    """Fetch one /markets page."""
+    return await get_json(session, f"{BASE_URL}/markets", params={"next_cursor": cursor})
+
+
+def _parse_end(end_date_iso: str | None) -> datetime | None:
+    """Parse a market's end_date_iso as an aware UTC datetime."""
+    if not end_date_iso:
+        return None
+    end_dt = datetime.fromisoformat(end_date_iso.replace("Z", "+00:00"))
+    if end_dt.tzinfo is None:
+        end_dt = end_dt.replace(tzinfo=timezone.utc)
+    return end_dt
+
+
+def _match_market(market: dict, matches: Callable[[str], bool], now: datetime) -> dict | None:
+    """Result row for ``market`` if it is open and its question matches."""
+    if market.get("closed"):
+        return None
+
+    # Only a tiny fraction of markets match, so test the question before
+    # spending anything on date parsing and formatting.
+    question = market.get("question") or ""
+    if not matches(question):
+        return None
+
+    end_dt = _parse_end(market.get("end_date_iso"))
+    if end_dt is not None and end_dt < now:
+        return None
+
+    return {
+        "question": question,
+        "condition_id": market.get("condition_id"),
+        "status": "active" if market.get("active") else "inactive",
+        "end_date": end_dt.strftime("%Y-%m-%d %H:%M") + " UTC" if end_dt else "N/A",
+    }
+
+
+def _collect(
+    page: dict, select: Callable[[dict], dict | None], results: list[dict], max_matches: int
+) -> bool:
+    """Append the rows ``select`` makes from ``page``; True once ``max_matches`` is reached."""
+    for market in page.get("data") or ():
+        row = select(market)
+        if row is not None:
+            results.append(row)
+            if len(results) >= max_matches:
+                return True
+    return False
+
+
+async def stream_page(
+    session: aiohttp.ClientSession,
+    cursor: str,
+    select: Callable[[dict], dict | None],
+    results: list[dict],
+    max_matches: int,
+) -> dict | None:
+    """
+    Fetch one /markets page, matching markets while the body is still arriving.
+
+    Returns the page, or None if ``max_matches`` was reached part way through;
+    the rest of the response is then never read and the connection is dropped.
+    """
+    page: dict = {"data": []}
+    url = f"{BASE_URL}/markets"
+    async with await request(session, "GET", url, params={"next_cursor": cursor}) as resp:
+        builder = None
+        async for prefix, event, value in ijson.parse(resp.content, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == "data.item" and event == "end_map":
+                    market, builder = builder.value, None
+                    page["data"].append(market)
+                    row = select(market)
+                    if row is not None:
+                        results.append(row)
+                        if len(results) >= max_matches:
+                            return None
+            elif prefix == "data.item" and event == "start_map":
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            elif prefix == "next_cursor":
+                page["next_cursor"] = value
+    return page
+
+
+async def find_markets_async(
+    keywords: list[str], max_matches: int = 3, max_pages: int = 100, use_cache: bool = True
+) -> list[dict]:
+    """
+    Scan up to ``max_pages`` pages and return at most ``max_matches`` markets.
+
+    With ``use_cache``, pages fetched within the last ``PageCache.max_age``
+    seconds are replayed from the page cache instead of being downloaded again.
+    """
+    results: list[dict] = []
+    select = functools.partial(
+        _match_market,
+        matches=build_matcher(fold_keywords(keywords)),
+        now=datetime.now(timezone.utc),
+    )
+    cache = _PAGE_CACHE if use_cache else None
+    limiter = asyncio.BoundedSemaphore(CONCURRENCY)
+
+    async with open_session(CONCURRENCY) as session:
+
+        async def load(cursor: str) -> tuple[dict, bool]:
+            """Page for ``cursor`` and whether it had to be downloaded."""
+            if cache is not None:
+                page = cache.get(_page_key(cursor))
+                if page is not None:
+                    return page, False
+            async with limiter:
+                return await fetch_page(session, cursor), True
+
+        cursor = FIRST_CURSOR
+        step = None  # offset delta between pages, learned from the first page
+        speculate = True  # cleared for good once a guessed cursor turns out wrong
+        pages = 0
+        while cursor and cursor != END_CURSOR and pages < max_pages:
+            batch = _cursor_batch(cursor, step, min(CONCURRENCY, max_pages - pages))
+            hit = cache.get(_page_key(cursor)) if cache is not None and len(batch) == 1 else None
+            streamed = len(batch) == 1 and hit is None
+            if streamed:
+                # Nothing to prefetch, so stream the page: a match near its top
+                # returns without waiting for the rest of the body.
+                async with limiter:
+                    page = await stream_page(session, cursor, select, results, max_matches)
+                if page is None:
+                    return results
+                fetched = [(page, True)]
+            elif hit is not None:
+                fetched = [(hit, False)]
+            else:
+                fetched = await asyncio.gather(*(load(c) for c in batch), return_exceptions=True)
+
+            # Walk the batch in order, only trusting a speculative page if the
+            # page before it really pointed at its cursor.
+            for i, loaded in enumerate(fetched):
+                if isinstance(loaded, BaseException):
+                    raise loaded
+                page, fresh = loaded
+                pages += 1
+                next_cursor = page.get("next_cursor")
+                # The last page is the one that grows as markets are listed, so
+                # it is always fetched live.
+                if fresh and cache is not None and page.get("data") and next_cursor != END_CURSOR:
+                    cache.put(_page_key(batch[i]), page)
+                if not streamed and _collect(page, select, results, max_matches):
+                    return results
+
+                if step is None and speculate:
+                    start, nxt = _decode_cursor(batch[i]), _decode_cursor(next_cursor or "")
+                    if start is not None and nxt is not None and nxt > start:
+                        step = nxt - start
+                if not page.get("data") or next_cursor == END_CURSOR:
+                    return results
+                cursor = next_cursor
+                if i + 1 == len(batch):
+                    break
+                if batch[i + 1] != next_cursor:
+                    # The server is not following the offset scheme; stop
+                    # guessing rather than wasting a batch of requests per page.
+                    step, speculate = None, False
+                    break
+
+    return results
+
+
+def find_markets(
+    keywords: list[str], max_matches: int = 3, max_pages: int = 100, use_cache: bool = True
+) -> list[dict]:
+    """Blocking wrapper around :func:`find_markets_async`."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(
+            find_markets_async(keywords, max_matches, max_pages, use_cache)
+        )
+    finally:
+        loop.close()
@@ -1,7 +1,7 @@
 """
 General-purpose Polymarket market finder with pagination.
 
-Step 1 (skeleton): wire up CLI and helpers; do not make HTTP calls yet.
+Pages are fetched by market_parity.io.markets, several at a time.
 
 Usage examples:
   python scripts/find_markets.py --keywords Fed bps --max-matches 3 --max-pages 100
@@ -10,6 +10,7 @@ Usage examples:
 
 from __future__ import annotations
 import argparse
+import sys
 from market_parity.io.markets import find_markets
 
 
@@ -35,19 +36,30 @@ def parse_args() -> argparse.Namespace:
         default=100,
         help="Maximum number of pages to scan via next_cursor (default: 100).",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore the on-disk page cache and fetch every page live.",
+    )
     # Reserved for later:
     # parser.add_argument("--probe", action="store_true",
     #     help="If set, fetch the YES mid for the first result via adapters.polymarket.")
     return parser.parse_args()
 
 
+RULE = "-" * 72
+
+
 def render_match(question: str, condition_id: str, status: str, end_date: str) -> None:
     """Pretty-print a found market."""
-    print("Question:", question)
-    print("Condition ID:", condition_id)
-    print("Status:", status)
-    print("End Date:", end_date)
-    print("-" * 72)
+    # One write per match rather than one per line; stdout is flushed once in main().
+    sys.stdout.write(
+        f"Question: {question}\n"
+        f"Condition ID: {condition_id}\n"
+        f"Status: {status}\n"
+        f"End Date: {end_date}\n"
+        f"{RULE}\n"
+    )
 
 
 def main() -> None:
@@ -57,7 +69,8 @@ def main() -> None:
     results = find_markets(
         keywords=args.keywords,
         max_matches=args.max_matches,
-        max_pages=args.max_pages
+        max_pages=args.max_pages,
+        use_cache=not args.no_cache,
     )
     
     # Print results
@@ -71,6 +84,7 @@ def main() -> None:
     
     if not results:
         print(f"No markets found containing: {args.keywords}")
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,71 @@
+import time
+from pathlib import Path
+
+import zstandard
+
+from market_parity.io.cache import PageCache
+
+PAGE = {"data": [{"question": "Will the Fed cut?"}], "next_cursor": "MTA="}
+
+
+def test_round_trip_through_disk(tmp_path):
+    PageCache(tmp_path).put("url", PAGE)
+    # A fresh instance has an empty memory tier, so this reads the file.
+    assert PageCache(tmp_path).get("url") == PAGE
+    assert PageCache(tmp_path).get("other") is None
+
+
+def test_memory_tier_is_lru(tmp_path):
+    cache = PageCache(tmp_path, maxsize=2)
+    for key in ("a", "b", "c"):
+        cache.put(key, {"key": key})
+    assert list(cache._memory) == ["b", "c"]
+
+
+def test_unwritable_directory_is_not_an_error(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    cache = PageCache(blocker / "pages")  # parent is a file, so mkdir fails
+    cache.put("url", PAGE)
+    assert cache.get("url") == PAGE  # still served from memory
+    assert PageCache(blocker / "pages").get("url") is None
+
+
+def test_corrupt_or_unreadable_file_is_a_miss(tmp_path):
+    cache = PageCache(tmp_path)
+    cache.put("url", PAGE)
+    cache._path("url").write_bytes(zstandard.compress(b"{not json"))
+    assert PageCache(tmp_path).get("url") is None
+
+    cache._path("url").unlink()
+    cache._path("url").mkdir()  # reading a directory raises IsADirectoryError
+    assert PageCache(tmp_path).get("url") is None
+
+
+def test_expired_entries_are_misses(tmp_path, monkeypatch):
+    cache = PageCache(tmp_path, max_age=60)
+    cache.put("url", PAGE)
+    assert cache.get("url") == PAGE
+
+    later = time.time() + 61
+    monkeypatch.setattr(time, "time", lambda: later)
+    assert cache.get("url") is None  # memory tier
+    assert PageCache(tmp_path, max_age=60).get("url") is None  # disk tier, by mtime
+
+
+def test_no_home_directory_falls_back_to_memory(monkeypatch):
+    def no_home():
+        raise RuntimeError("Could not determine home directory.")
+
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    monkeypatch.setattr(Path, "home", no_home)
+    cache = PageCache()
+    assert cache.directory is None
+    cache.put("url", PAGE)
+    assert cache.get("url") == PAGE
+    assert PageCache().get("url") is None
+
+
+def test_default_dir_follows_xdg_cache_home(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert PageCache().directory == tmp_path / "poly_arb" / "pages"
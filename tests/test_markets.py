@@ -0,0 +1,173 @@
+import asyncio
+import base64
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer, unused_port
+
+from market_parity.io import markets
+from market_parity.io.cache import PageCache
+
+WORDS = ["fed", "bps", "oil", "cut", "rate", "hike"]
+
+
+def _encode(offset):
+    return base64.b64encode(str(offset).encode()).decode()
+
+
+def _make_markets(n):
+    out = []
+    for i in range(n):
+        words = [w for j, w in enumerate(WORDS) if (i >> j) & 1]
+        out.append({
+            "question": f"Market {i}: " + " ".join(w.upper() if i % 3 else w for w in words),
+            "condition_id": f"0x{i:04x}",
+            "active": True,
+            "closed": i % 11 == 5,
+            "end_date_iso": "2001-01-01T00:00:00Z" if i % 13 == 7 else "2099-01-01T00:00:00Z",
+        })
+    return out
+
+
+class FakeClob:
+    """
+    Serves /markets in pages of ``page_sizes`` (cycled), with base64 offset
+    cursors, or opaque ones when ``opaque`` is set.
+    """
+
+    def __init__(self, markets_, page_sizes=(10,), opaque=False):
+        self.markets = markets_
+        self.requested = []
+        self.bounds = []
+        offset, k = 0, 0
+        while offset < len(markets_):
+            size = page_sizes[k % len(page_sizes)]
+            self.bounds.append((offset, min(offset + size, len(markets_))))
+            offset += size
+            k += 1
+        self.opaque = opaque
+
+    def cursor(self, page):
+        if page >= len(self.bounds):
+            return markets.END_CURSOR
+        if page == 0:
+            return markets.FIRST_CURSOR
+        return f"page-{page}" if self.opaque else _encode(self.bounds[page][0])
+
+    async def handle(self, request):
+        cursor = request.query["next_cursor"]
+        self.requested.append(cursor)
+        pages = {self.cursor(p): p for p in range(len(self.bounds))}
+        if cursor not in pages:
+            return web.json_response({"data": [], "next_cursor": markets.END_CURSOR})
+        page = pages[cursor]
+        lo, hi = self.bounds[page]
+        return web.json_response({
+            "data": self.markets[lo:hi],
+            "next_cursor": self.cursor(page + 1),
+        })
+
+
+def _search(clob, monkeypatch, keywords, max_matches=3, max_pages=100, cache=None, port=None):
+    async def run():
+        app = web.Application()
+        app.router.add_get("/markets", clob.handle)
+        async with TestServer(app, port=port) as server:
+            monkeypatch.setattr(markets, "BASE_URL", str(server.make_url("")).rstrip("/"))
+            return await markets.find_markets_async(
+                keywords, max_matches, max_pages, use_cache=cache is not None
+            )
+
+    if cache is not None:
+        monkeypatch.setattr(markets, "_PAGE_CACHE", cache)
+    return asyncio.run(run())
+
+
+def _brute_force(markets_, keywords, max_matches, max_pages, bounds):
+    limit = bounds[min(max_pages, len(bounds)) - 1][1]
+    found = []
+    for m in markets_[:limit]:
+        q = m["question"].casefold()
+        if m["closed"] or m["end_date_iso"].startswith("2001"):
+            continue
+        if all(k.casefold() in q for k in keywords):
+            found.append(m["condition_id"])
+    return found[:max_matches]
+
+
+@pytest.mark.parametrize("keywords", [["fed"], ["Fed", "BPS"], ["oil", "cut", "hike"], ["nothing"]])
+@pytest.mark.parametrize("max_matches", [1, 4, 1000])
+@pytest.mark.parametrize("max_pages", [1, 3, 100])
+@pytest.mark.parametrize("page_sizes", [(10,), (7, 9)])
+def test_find_markets_matches_brute_force(monkeypatch, keywords, max_matches, max_pages, page_sizes):
+    data = _make_markets(95)
+    clob = FakeClob(data, page_sizes)
+    results = _search(clob, monkeypatch, keywords, max_matches, max_pages)
+    expected = _brute_force(data, keywords, max_matches, max_pages, clob.bounds)
+    assert [r["condition_id"] for r in results] == expected
+
+
+def test_prefetches_pages_once_step_is_known(monkeypatch):
+    clob = FakeClob(_make_markets(200), (10,))
+    _search(clob, monkeypatch, ["nothing"], max_pages=9)
+    # First page alone, then one speculative batch covering the other eight.
+    assert len(clob.requested) == 9
+    assert clob.requested[0] == markets.FIRST_CURSOR
+
+
+def test_stops_speculating_after_a_cursor_mismatch(monkeypatch):
+    data = _make_markets(200)
+    clob = FakeClob(data, (10, 15))
+    results = _search(clob, monkeypatch, ["fed"], max_matches=1000)
+    assert [r["condition_id"] for r in results] == _brute_force(data, ["fed"], 1000, 100, clob.bounds)
+    # One speculative batch of CONCURRENCY is wasted, then one request per page.
+    assert len(clob.requested) == len(clob.bounds) + markets.CONCURRENCY - 1
+
+
+def test_opaque_cursors_are_fetched_sequentially(monkeypatch):
+    data = _make_markets(60)
+    clob = FakeClob(data, (10,), opaque=True)
+    results = _search(clob, monkeypatch, ["oil"], max_matches=1000)
+    assert [r["condition_id"] for r in results] == _brute_force(data, ["oil"], 1000, 100, clob.bounds)
+    assert len(clob.requested) == len(clob.bounds)
+
+
+def test_early_match_on_streamed_first_page_stops_the_scan(monkeypatch):
+    clob = FakeClob(_make_markets(200), (50,))
+    results = _search(clob, monkeypatch, ["fed"], max_matches=1)
+    assert [r["condition_id"] for r in results] == ["0x0001"]
+    assert clob.requested == [markets.FIRST_CURSOR]
+
+
+def test_walked_pages_are_cached_except_the_last(monkeypatch, tmp_path):
+    data = _make_markets(30)
+    cache = PageCache(tmp_path)
+    port = unused_port()  # cache keys include the server URL, so reuse it
+    clob = FakeClob(data, (10,))
+    first = _search(clob, monkeypatch, ["fed"], max_matches=1000, cache=cache, port=port)
+    cursors = [clob.cursor(p) for p in range(3)]
+    assert [cache.get(markets._page_key(c)) is not None for c in cursors] == [True, True, False]
+
+    replay = FakeClob(data, (10,))
+    assert _search(replay, monkeypatch, ["fed"], max_matches=1000, cache=cache, port=port) == first
+    assert cursors[0] not in replay.requested and cursors[1] not in replay.requested
+    assert cursors[2] in replay.requested
+
+
+def test_partially_streamed_page_is_not_cached(monkeypatch, tmp_path):
+    cache = PageCache(tmp_path)
+    clob = FakeClob(_make_markets(30), (10,))
+    _search(clob, monkeypatch, ["fed"], max_matches=1, cache=cache)
+    assert cache.get(markets._page_key(markets.FIRST_CURSOR)) is None
+
+
+@pytest.mark.parametrize("keywords, question, expected", [
+    (["Fed", "bps"], "Will the FED cut 25 BPS?", True),
+    (["fed rate", "rate cut"], "fed rate cut", True),
+    (["fed", "hike"], "Will the Fed cut?", False),
+    (["ß"], "STRASSE", True),
+    (["it's", 'a"b\\'], 'IT\'S A"B\\', True),
+    ([], "anything", True),
+])
+def test_build_matcher(keywords, question, expected):
+    assert markets.build_matcher(markets.fold_keywords(keywords))(question) is expected
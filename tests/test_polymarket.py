@@ -0,0 +1,114 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from market_parity.adapters import polymarket
+
+
+class FakeClob:
+    """Serves /markets/{id} and the batched POST /books endpoint."""
+
+    def __init__(self, books, delay=0.0):
+        self.books = books  # token_id -> book body (without asset_id)
+        self.delay = delay  # seconds to stall every market but "no-yes"
+        self.market_requests = []
+        self.book_batches = []
+
+    async def market(self, request):
+        market_id = request.match_info["id"]
+        self.market_requests.append(market_id)
+        if market_id == "no-yes":
+            return web.json_response({"tokens": [{"outcome": "NO", "token_id": "n"}]})
+        await asyncio.sleep(self.delay)
+        return web.json_response({"tokens": [
+            {"outcome": "NO", "token_id": f"no-{market_id}"},
+            {"outcome": "YES", "token_id": f"yes-{market_id}"},
+        ]})
+
+    async def books_handler(self, request):
+        body = await request.json()
+        tokens = [b["token_id"] for b in body]
+        self.book_batches.append(tokens)
+        # Reply out of order; the adapter has to match books by asset_id.
+        return web.json_response([
+            {"asset_id": t, **self.books[t]} for t in reversed(tokens) if t in self.books
+        ])
+
+
+@pytest.fixture(autouse=True)
+def _clear_token_cache():
+    polymarket.clear_cache()
+    yield
+    polymarket.clear_cache()
+
+
+def _book(bid, ask):
+    return {"bids": [{"price": str(bid)}], "asks": [{"price": str(ask)}]}
+
+
+def _fetch(clob, monkeypatch, *calls):
+    async def run():
+        app = web.Application()
+        app.router.add_get("/markets/{id}", clob.market)
+        app.router.add_post("/books", clob.books_handler)
+        async with TestServer(app) as server:
+            monkeypatch.setattr(polymarket, "BASE_URL", str(server.make_url("")).rstrip("/"))
+            return [await polymarket.fetch_many(ids) for ids in calls]
+
+    return asyncio.run(run())
+
+
+def test_fetch_many_keeps_input_order_across_batches(monkeypatch):
+    monkeypatch.setattr(polymarket, "BOOKS_PER_REQUEST", 2)
+    ids = ["m1", "m2", "m3", "m4", "m5"]
+    clob = FakeClob({f"yes-{m}": _book(i / 10, i / 10 + 0.05) for i, m in enumerate(ids)})
+    (snaps,) = _fetch(clob, monkeypatch, ids)
+    assert [s.market_id for s in snaps] == ids
+    assert [s.yes_bid for s in snaps] == [0.0, 0.1, 0.2, 0.3, 0.4]
+    assert snaps[1].yes_mid == pytest.approx(0.125)
+    assert sorted(len(b) for b in clob.book_batches) == [1, 2, 2]
+
+
+def test_empty_book_sides_default_to_zero_and_one(monkeypatch):
+    clob = FakeClob({"yes-m1": {"bids": [], "asks": []}})
+    (snaps,) = _fetch(clob, monkeypatch, ["m1"])
+    assert (snaps[0].yes_bid, snaps[0].yes_ask, snaps[0].yes_mid) == (0.0, 1.0, 0.5)
+
+
+def test_yes_token_ids_are_cached_between_sweeps(monkeypatch):
+    clob = FakeClob({"yes-m1": _book(0.4, 0.5), "yes-m2": _book(0.2, 0.3)})
+    _fetch(clob, monkeypatch, ["m1"], ["m1", "m2"])
+    assert clob.market_requests == ["m1", "m2"]
+    assert len(clob.book_batches) == 2
+
+
+def test_missing_yes_token_raises(monkeypatch):
+    with pytest.raises(ValueError, match="No YES token"):
+        _fetch(FakeClob({}), monkeypatch, ["no-yes"])
+
+
+def test_missing_book_raises(monkeypatch):
+    with pytest.raises(ValueError, match="No order book"):
+        _fetch(FakeClob({}), monkeypatch, ["m1"])
+
+
+def test_failed_lookup_cancels_the_other_lookups(monkeypatch):
+    stray = []
+
+    async def run():
+        app = web.Application()
+        app.router.add_get("/markets/{id}", FakeClob({}, delay=0.2).market)
+        async with TestServer(app) as server:
+            monkeypatch.setattr(polymarket, "BASE_URL", str(server.make_url("")).rstrip("/"))
+            with pytest.raises(ValueError, match="No YES token"):
+                await polymarket.fetch_many(["no-yes", "a", "b"])
+            stray.extend(
+                t for t in asyncio.all_tasks()
+                if t.get_coro().__name__ == "_resolve_yes_token_id"
+            )
+
+    asyncio.run(run())
+    assert stray == []
+    assert len(polymarket._YES_TOKEN_IDS) == 0
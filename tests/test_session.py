@@ -0,0 +1,79 @@
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from market_parity.io import _session
+
+
+@pytest.fixture(autouse=True)
+def _no_backoff(monkeypatch):
+    monkeypatch.setattr(_session, "BACKOFF", 0.001)
+
+
+class FlakySession:
+    """Wraps a real session; the first ``failures`` requests raise ``error``."""
+
+    def __init__(self, session, failures, error):
+        self.session = session
+        self.failures = failures
+        self.error = error
+
+    async def request(self, *args, **kwargs):
+        if self.failures:
+            self.failures -= 1
+            raise self.error
+        return await self.session.request(*args, **kwargs)
+
+
+def _get(statuses, failures=0, error=aiohttp.ClientConnectionError()):
+    """GET /thing from a server replying with ``statuses`` in turn, then 200."""
+    hits = []
+
+    async def handler(request):
+        hits.append(request.method)
+        status = statuses[len(hits) - 1] if len(hits) <= len(statuses) else 200
+        return web.json_response({"ok": True}, status=status)
+
+    async def run():
+        app = web.Application()
+        app.router.add_get("/thing", handler)
+        async with TestServer(app) as server, aiohttp.ClientSession() as session:
+            flaky = FlakySession(session, failures, error)
+            return await _session.get_json(flaky, str(server.make_url("/thing")))
+
+    try:
+        return asyncio.run(run()), len(hits)
+    except Exception as exc:
+        exc.hits = len(hits)
+        raise
+
+
+def test_retryable_status_then_success():
+    assert _get([503]) == ({"ok": True}, 2)
+
+
+def test_non_retryable_status_raises_at_once():
+    with pytest.raises(aiohttp.ClientResponseError) as info:
+        _get([404])
+    assert info.value.status == 404
+    assert info.value.hits == 1
+
+
+def test_constant_rate_limit_gives_up_after_all_retries():
+    with pytest.raises(aiohttp.ClientResponseError) as info:
+        _get([429] * 10)
+    assert info.value.status == 429
+    assert info.value.hits == _session.RETRIES + 1
+
+
+@pytest.mark.parametrize("error", [aiohttp.ClientConnectionError(), asyncio.TimeoutError()])
+def test_connection_errors_and_timeouts_are_retried(error):
+    assert _get([], failures=_session.RETRIES, error=error) == ({"ok": True}, 1)
+
+
+def test_connection_errors_give_up_after_all_retries():
+    with pytest.raises(aiohttp.ClientConnectionError):
+        _get([], failures=_session.RETRIES + 1)
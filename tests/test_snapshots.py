@@ -0,0 +1,49 @@
+import dataclasses
+
+import numpy as np
+import pytest
+
+from market_parity.domain.snapshots import PolySnapshot, PolySnapshotBatch
+
+ROWS = [
+    {"market_id": "a", "yes_bid": 0.41, "yes_ask": 0.455},
+    {"market_id": "b", "yes_bid": 0.0, "yes_ask": 1.0},
+    {"market_id": "c", "yes_bid": 0.999, "yes_ask": 1.0},
+    {"market_id": "d", "yes_bid": 0.1234, "yes_ask": 0.2996},  # off-tick, rounds
+]
+
+
+def test_prices_round_to_int16_ticks():
+    batch = PolySnapshotBatch.from_dicts(ROWS)
+    assert batch.yes_bid_ticks.dtype == np.int16
+    assert batch.yes_bid_ticks.tolist() == [410, 0, 999, 123]
+    assert batch.yes_ask_ticks.tolist() == [455, 1000, 1000, 300]
+    np.testing.assert_allclose(batch.yes_bid, [0.41, 0.0, 0.999, 0.123], atol=1e-6)
+
+
+def test_mid_keeps_half_ticks():
+    batch = PolySnapshotBatch.from_dicts(ROWS)
+    np.testing.assert_allclose(batch.yes_mid, [0.4325, 0.5, 0.9995, 0.2115], atol=1e-6)
+
+
+def test_getitem_rebuilds_snapshot():
+    batch = PolySnapshotBatch.from_dicts(ROWS)
+    assert len(batch) == 4
+    snap = batch[0]
+    assert isinstance(snap, PolySnapshot)
+    assert (snap.market_id, snap.yes_bid, snap.yes_ask, snap.yes_mid) == ("a", 0.41, 0.455, 0.4325)
+    assert snap.ts_ns == int(batch.ts[0].astype(np.int64))
+    assert snap.ts.endswith("+00:00")
+
+
+def test_empty_batch():
+    batch = PolySnapshotBatch.from_dicts([])
+    assert len(batch) == 0
+    assert batch.yes_mid.shape == (0,)
+
+
+def test_snapshot_is_frozen_and_hashable():
+    snap = PolySnapshot("a", 0, 0.4, 0.5, 0.45)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snap.yes_bid = 0.3
+    assert len({snap, PolySnapshot("a", 0, 0.4, 0.5, 0.45)}) == 1